@@ -93,7 +93,8 @@ class JsonCluster(Cluster):
             cluster_file = kwargs.get("cluster_file")
             if cluster_file is None:
                 cluster_file = ConsoleDefaults.CLUSTER_FILE
-            cluster_json = json.load(open(os.path.abspath(cluster_file)))
+            with open(os.path.abspath(cluster_file)) as fd:
+                cluster_json = json.load(fd)
         try:
             for ninfo in cluster_json["nodes"]:
                 ssh_config_dict = ninfo.get("ssh_config")
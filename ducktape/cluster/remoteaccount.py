@@ -250,11 +250,19 @@ class RemoteAccount(HttpMixin):
     def __repr__(self):
         return str(self.__dict__)
 
+    def _identity(self):
+        """The fields that identify the remote machine and how we log in to it.
+
+        Connection state, loggers and ssh exception checks are deliberately left out. This is computed on each
+        call rather than cached, since e.g. externally_routable_ip can be filled in after construction.
+        """
+        return self.ssh_config, self.externally_routable_ip, self.os
+
     def __eq__(self, other):
-        return other is not None and self.__dict__ == other.__dict__
+        return isinstance(other, RemoteAccount) and self._identity() == other._identity()
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+        return hash(self._identity())
 
     def wait_for_http_service(self, port, headers, timeout=20, path='/'):
         """Wait until this service node is available/awake."""
@@ -480,6 +488,15 @@ class RemoteAccount(HttpMixin):
         """
         # TODO: if dest is an existing file, what is the behavior?
 
+        if self.isfile(src):
+            # stream a single file straight from one sftp session into the other; with prefetch the download
+            # runs ahead of the upload instead of landing on local disk first
+            if dest_node.account.isdir(dest):
+                dest = self._re_anchor_basename(src, dest)
+            with self._open_prefetched(src) as src_file:
+                dest_node.account._put_stream(src_file, dest)
+            return
+
         temp_dir = tempfile.mkdtemp()
 
         try:
@@ -495,6 +512,22 @@ class RemoteAccount(HttpMixin):
             if os.path.isdir(temp_dir):
                 shutil.rmtree(temp_dir)
 
+    @check_ssh
+    def _open_prefetched(self, path):
+        """Open the remote file at path for reading and start fetching its contents in the background."""
+        remote_file = self.sftp_client.open(path, "r")
+        try:
+            remote_file.prefetch()
+        except BaseException:
+            remote_file.close()
+            raise
+        return remote_file
+
+    @check_ssh
+    def _put_stream(self, fl, path):
+        """Upload the contents of the open file object fl to path on this account."""
+        self.sftp_client.putfo(fl, path)
+
     def scp_from(self, src, dest, recursive=False):
         warnings.warn("scp_from is now deprecated. Please use copy_from")
         self.copy_from(src, dest)
@@ -536,16 +569,28 @@ class RemoteAccount(HttpMixin):
             self.sftp_client.get(src, dest)
         elif self.isdir(src):
             # we can now assume dest path looks like: path_that_exists/new_directory
-            os.mkdir(dest)
+            self._copy_dir_from(src, dest)
 
-            # for obj in `ls src`, if it's a file, copy with copy_file_from, elif its a directory, call again
-            for obj in self.sftp_client.listdir(src):
-                obj_path = os.path.join(src, obj)
-                if self.isfile(obj_path) or self.isdir(obj_path):
-                    self.copy_from(obj_path, dest)
-                else:
-                    # TODO what about uncopyable file types?
-                    pass
+    def _copy_dir_from(self, src, dest):
+        """Recursively copy the remote directory src to the local path dest, which must not exist yet.
+
+        The attributes returned by listdir_attr tell files and directories apart, so only symlinks cost an
+        extra stat round trip.
+        """
+        os.mkdir(dest)
+
+        for attr in self.sftp_client.listdir_attr(src):
+            obj_path = os.path.join(src, attr.filename)
+            if stat.S_ISREG(attr.st_mode):
+                self.sftp_client.get(obj_path, os.path.join(dest, attr.filename))
+            elif stat.S_ISDIR(attr.st_mode):
+                self._copy_dir_from(obj_path, os.path.join(dest, attr.filename))
+            elif stat.S_ISLNK(attr.st_mode):
+                # listdir_attr doesn't follow symlinks, so let copy_from resolve what the link points to
+                self.copy_from(obj_path, dest)
+            else:
+                # TODO what about uncopyable file types?
+                pass
 
     def scp_to(self, src, dest, recursive=False):
         warnings.warn("scp_to is now deprecated. Please use copy_to")
@@ -565,13 +610,22 @@ class RemoteAccount(HttpMixin):
             self.sftp_client.put(src, dest)
         elif os.path.isdir(src):
             # we can now assume dest path looks like: path_that_exists/new_directory
-            self.mkdir(dest)
+            self._copy_dir_to(src, dest)
 
-            # for obj in `ls src`, if it's a file, copy with copy_file_from, elif its a directory, call again
-            for obj in os.listdir(src):
-                obj_path = os.path.join(src, obj)
-                if os.path.isfile(obj_path) or os.path.isdir(obj_path):
-                    self.copy_to(obj_path, dest)
+    def _copy_dir_to(self, src, dest):
+        """Recursively copy the local directory src to the remote path dest, which must not exist yet.
+
+        dest is known not to exist, so unlike copy_to this doesn't stat the remote side once per entry.
+        """
+        self.mkdir(dest)
+
+        with os.scandir(src) as entries:
+            for entry in entries:
+                # follow symlinks, the same as os.path.isfile/isdir
+                if entry.is_file():
+                    self.sftp_client.put(entry.path, os.path.join(dest, entry.name))
+                elif entry.is_dir():
+                    self._copy_dir_to(entry.path, os.path.join(dest, entry.name))
                 else:
                     # TODO what about uncopyable file types?
                     pass
@@ -750,7 +804,8 @@ class LogMonitor(object):
         offset recorded when the LogMonitor was created. Additional keyword args
         are passed directly to ``ducktape.utils.util.wait_until``
         """
-        return wait_until(lambda: self.acct.ssh("tail -c +%d %s | grep '%s'" % (self.offset + 1, self.log, pattern),
+        # grep -q stops reading at the first match and sends nothing back, we only need the exit status
+        return wait_until(lambda: self.acct.ssh("tail -c +%d %s | grep -q '%s'" % (self.offset + 1, self.log, pattern),
                                                 allow_fail=True) == 0, **kwargs)
 
 
@@ -1,13 +1,25 @@
 from setuptools import find_packages, setup
 from setuptools.command.test import test as TestCommand
+import os
 import re
+import subprocess
 import sys
 
-version = ''
-with open('ducktape/__init__.py', 'r') as fd:
-    version = re.search(r'^__version__\s*=\s*[\'"]([^\'"]*)[\'"]',
-                        fd.read(), re.MULTILINE).group(1)
 
+VERSION_RE = re.compile(r'^__version__\s*=\s*[\'"]([^\'"]*)[\'"]')
+
+
+def read_version():
+    """Return the version declared in ducktape/__init__.py, stopping at the first __version__ line."""
+    with open('ducktape/__init__.py', 'r') as fd:
+        for line in fd:
+            match = VERSION_RE.match(line)
+            if match:
+                return match.group(1)
+    return ''
+
+
+version = read_version()
 if not version:
     raise RuntimeError('Cannot find version information')
 
@@ -25,14 +37,24 @@ class PyTest(TestCommand):
         self.test_suite = True
 
     def run_tests(self):
+        """Run pytest, then flake8 if the tests passed. Set SKIP_FLAKE8=1 to skip the style check."""
         # import here, cause outside the eggs aren't loaded
         import pytest
         errno = pytest.main(self.pytest_args)
-        self.run_command('flake8')
+        if errno == 0 and not os.environ.get('SKIP_FLAKE8'):
+            # flake8 no longer registers a setuptools command, so run it as a module
+            errno = subprocess.call([sys.executable, '-m', 'flake8'])
         sys.exit(errno)
 
 
-test_req = open('requirements-test.txt').read()
+def read_requirements(path):
+    """Return the requirement specifiers listed in path, skipping blank lines and comments."""
+    with open(path, 'r') as fd:
+        return [line.strip() for line in fd if line.strip() and not line.strip().startswith('#')]
+
+
+install_req = read_requirements('requirements.txt')
+test_req = read_requirements('requirements-test.txt')
 
 
 setup(name="ducktape",
@@ -45,12 +67,11 @@ setup(name="ducktape",
       },
       license="apache2.0",
       url="http://github.com/confluentinc/ducktape",
-      packages=find_packages(),
+      packages=find_packages(include=['ducktape', 'ducktape.*']),
       package_data={'ducktape': ['templates/report/*']},
       python_requires='>= 3.6',
-      install_requires=open('requirements.txt').read(),
+      install_requires=install_req,
       tests_require=test_req,
       extras_require={'test': test_req},
-      setup_requires=['flake8==3.8.3'],
       cmdclass={'test': PyTest},
       )
@@ -2,7 +2,10 @@
 This module contains tests that are useful for developer debugging
 and can contain sleep statements or test that intentionally fail or break things.
 They're separate from test_remote_account.py for that reason.
+
+Set DUCKTAPE_DEBUG_SLEEP_SCALE (e.g. to 0.01) to shorten the sleeps when the runner UI doesn't need watching.
 """
+import os
 import time
 
 from ducktape.mark import matrix, parametrize, ignore
@@ -10,6 +13,13 @@ from ducktape.mark.resource import cluster
 from ducktape.tests.test import Test
 from systests.cluster.test_remote_account import GenericService
 
+DEBUG_SLEEP_SCALE = float(os.environ.get('DUCKTAPE_DEBUG_SLEEP_SCALE', '1'))
+
+
+def debug_sleep(seconds):
+    """Sleep for the given number of seconds, scaled by DUCKTAPE_DEBUG_SLEEP_SCALE."""
+    time.sleep(seconds * DEBUG_SLEEP_SCALE)
+
 
 class FailingTest(Test):
     """
@@ -44,21 +54,21 @@ class DebugThisTest(Test):
     def one_node_test_sleep_90s(self):
         self.service = GenericService(self.test_context, 1)
         self.logger.warning('one_node_test - Sleeping for 90s')
-        time.sleep(90)
+        debug_sleep(90)
         assert True
 
     @cluster(num_nodes=1)
     def one_node_test_sleep_30s(self):
         self.service = GenericService(self.test_context, 1)
         self.logger.warning('another_one_node_test - Sleeping for 30s')
-        time.sleep(30)
+        debug_sleep(30)
         assert True
 
     @cluster(num_nodes=1)
     def another_one_node_test_sleep_30s(self):
         self.service = GenericService(self.test_context, 1)
         self.logger.warning('yet_another_one_node_test - Sleeping for 30s')
-        time.sleep(30)
+        debug_sleep(30)
         assert True
 
     @cluster(num_nodes=2)
@@ -90,7 +100,7 @@ class DebugThisTest(Test):
     def three_node_test_sleeping_30s(self):
         self.service = GenericService(self.test_context, 3)
         self.logger.warning('Sleeping for 30s')
-        time.sleep(30)
+        debug_sleep(30)
         assert True
 
     @cluster(num_nodes=3)
@@ -102,5 +112,4 @@ class DebugThisTest(Test):
     def bad_alloc_test(self):
         # @cluster annotation specifies 2 nodes, but we ask for 3, this will fail
         self.service = GenericService(self.test_context, 3)
-        time.sleep(10)
         assert True
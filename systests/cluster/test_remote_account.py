@@ -17,15 +17,18 @@ from ducktape.tests.test import Test
 from ducktape.errors import TimeoutError
 from ducktape.mark.resource import cluster
 
+from concurrent.futures import ThreadPoolExecutor
+import io
 import os
 import pytest
 import random
 import shutil
-from six import iteritems
+import tarfile
 import tempfile
 from threading import Thread
 import time
 import logging
+import uuid
 
 from ducktape.utils.util import wait_until
 
@@ -34,7 +37,7 @@ def generate_tempdir_name():
     """Use this ad-hoc function instead of the tempfile module since we're creating and removing
     this directory with ssh commands.
     """
-    return "/tmp/" + "t" + str(int(time.time()))
+    return "/tmp/" + "t" + uuid.uuid4().hex[:12]
 
 
 class RemoteAccountTestService(Service):
@@ -69,7 +72,9 @@ class RemoteAccountTestService(Service):
         node.account.ssh("rm -rf " + self.temp_dir)
 
     def write_to_log(self, msg):
-        self.nodes[0].account.ssh("echo -e -n " + repr(msg) + " >> " + self.log_file)
+        # append over the account's existing sftp session rather than exec'ing a remote shell per write
+        with self.nodes[0].account.open(self.log_file, "a") as f:
+            f.write(msg)
 
 
 class GenericService(Service):
@@ -78,8 +83,10 @@ class GenericService(Service):
     def __init__(self, context, num_nodes):
         super(GenericService, self).__init__(context, num_nodes)
         self.worker_scratch_dir = "scratch"
-        for node in self.nodes:
-            node.account.mkdirs(self.worker_scratch_dir)
+        # this is usually the first command on each node, so overlap the ssh connection setup across nodes,
+        # bounded so that larger services don't trip sshd's MaxStartups
+        with ThreadPoolExecutor(max_workers=min(len(self.nodes), 8) or 1) as executor:
+            list(executor.map(lambda node: node.account.mkdirs(self.worker_scratch_dir), self.nodes))
 
     def stop_node(self, node):
         # noop
@@ -256,66 +263,87 @@ DIR_STRUCTURE = {
 }
 
 
+def flatten_dir_structure(base_dir, dir_structure):
+    """Return (dirs, files) for the tree dir_structure rooted at base_dir.
+
+    dirs lists each subdirectory path, parents before children; files is a list of (path, contents) pairs.
+    """
+    dirs = []
+    files = []
+    stack = [(base_dir, dir_structure)]
+    while stack:
+        cur_dir, cur_structure = stack.pop()
+        for k, v in cur_structure.items():
+            path = os.path.join(cur_dir, k)
+            if isinstance(v, dict):
+                # it's a subdirectory
+                dirs.append(path)
+                stack.append((path, v))
+            else:
+                # it's a file
+                files.append((path, v))
+    return dirs, files
+
+
+def tar_dir_structure(dir_structure):
+    """Return the bytes of an uncompressed tar archive containing the tree described by dir_structure."""
+    dirs, files = flatten_dir_structure("", dir_structure)
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for dir_path in dirs:
+            info = tarfile.TarInfo(dir_path)
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            tar.addfile(info)
+        for file_path, file_contents in files:
+            info = tarfile.TarInfo(file_path)
+            info.size = len(file_contents)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(file_contents))
+    return buf.getvalue()
+
+
+# DIR_STRUCTURE never changes, so only archive it once
+DIR_STRUCTURE_TAR = tar_dir_structure(DIR_STRUCTURE)
+
+
 def make_dir_structure(base_dir, dir_structure, node=None):
     """Make a file tree starting at base_dir with structure specified by dir_structure.
 
     if node is None, make the structure locally, else make it on the given node
     """
-    for k, v in iteritems(dir_structure):
-        if isinstance(v, dict):
-            # it's a subdirectory
-            subdir_name = k
-            subdir_path = os.path.join(base_dir, subdir_name)
-            subdir_structure = v
-
-            if node:
-                node.account.mkdir(subdir_path)
-            else:
-                os.mkdir(subdir_path)
+    tar_bytes = DIR_STRUCTURE_TAR if dir_structure is DIR_STRUCTURE else tar_dir_structure(dir_structure)
 
-            make_dir_structure(subdir_path, subdir_structure, node)
-        else:
-            # it's a file
-            file_name = k
-            file_path = os.path.join(base_dir, file_name)
-            file_contents = v
-
-            if node:
-                with node.account.open(file_path, "wb") as f:
-                    f.write(file_contents)
-            else:
-                with open(file_path, "wb") as f:
-                    f.write(file_contents)
+    if node:
+        # upload the whole tree as one archive and unpack it with a single remote command
+        tar_path = generate_tempdir_name() + ".tar"
+        node.account.create_file(tar_path, tar_bytes)
+        node.account.ssh("tar -xf %s -C %s; status=$?; rm -f %s; exit $status" % (tar_path, base_dir, tar_path))
+    else:
+        with tarfile.open(fileobj=io.BytesIO(tar_bytes)) as tar:
+            # use the safe 'data' filter where available; we built this archive ourselves in any case
+            tar.extraction_filter = getattr(tarfile, "data_filter", None)
+            tar.extractall(base_dir)
 
 
 def verify_dir_structure(base_dir, dir_structure, node=None):
     """Verify locally or on the given node whether the file subtree at base_dir matches dir_structure."""
-    for k, v in iteritems(dir_structure):
-        if isinstance(v, dict):
-            # it's a subdirectory
-            subdir_name = k
-            subdir_path = os.path.join(base_dir, subdir_name)
-            subdir_structure = v
-
-            if node:
-                assert node.account.isdir(subdir_path)
-            else:
-                assert os.path.isdir(subdir_path)
+    dirs, files = flatten_dir_structure(base_dir, dir_structure)
 
-            verify_dir_structure(subdir_path, subdir_structure, node)
+    for subdir_path in dirs:
+        if node:
+            assert node.account.isdir(subdir_path)
         else:
-            # it's a file
-            file_name = k
-            file_path = os.path.join(base_dir, file_name)
-            expected_file_contents = v
-
-            if node:
-                with node.account.open(file_path, "r") as f:
-                    contents = f.read()
-            else:
-                with open(file_path, "rb") as f:
-                    contents = f.read()
-            assert expected_file_contents == contents, contents
+            assert os.path.isdir(subdir_path)
+
+    for file_path, expected_file_contents in files:
+        if node:
+            with node.account.open(file_path, "r") as f:
+                contents = f.read()
+        else:
+            with open(file_path, "rb") as f:
+                contents = f.read()
+        assert expected_file_contents == contents, contents
 
 
 class CopyToAndFroTest(Test):
@@ -467,9 +495,9 @@ class RemoteAccountTest(Test):
         ssh_output = node.account.ssh_capture(cmd, combine_stderr=True)
         bad_ssh_output = node.account.ssh_capture(cmd, combine_stderr=False)  # Same command, but don't capture stderr
 
-        lines = [int(line.strip()) for line in ssh_output]
+        lines = list(map(int, ssh_output))
         assert lines == [i for i in range(1, 6)]
-        bad_lines = [int(line.strip()) for line in bad_ssh_output]
+        bad_lines = list(map(int, bad_ssh_output))
         assert bad_lines == []
 
     @cluster(num_nodes=1)
@@ -495,7 +523,7 @@ class RemoteAccountTest(Test):
         cmd = "for i in $(seq 1 5); do echo $i; done"
         ssh_output = node.account.ssh_capture(cmd, combine_stderr=False)
 
-        lines = [int(line.strip()) for line in ssh_output]
+        lines = list(map(int, ssh_output))
         assert lines == [i for i in range(1, 6)]
 
     @cluster(num_nodes=1)
@@ -521,15 +549,15 @@ class RemoteAccountTest(Test):
         self.wrote_log_line = False
 
         def background_logging_thread():
-            # This needs to be large enough that we can verify we've actually
-            # waited some time for the data to be written, but not too long that
-            # the test takes a long time
-            time.sleep(3)
+            # The monitor records its starting offset when monitor_log() is entered, so nothing written here can
+            # be missed. Sleeping gives wait_until time to poll the unchanged log at least once, which verifies
+            # that it actually waited for the new line
+            time.sleep(1)
             self.wrote_log_line = True
             self.account_service.write_to_log("foo\nbar\nbaz")
 
         with node.account.monitor_log(self.account_service.log_file) as monitor:
-            logging_thread = Thread(target=background_logging_thread)
+            logging_thread = Thread(target=background_logging_thread, daemon=True)
             logging_thread.start()
             monitor.wait_until('foo', timeout_sec=10, err_msg="Never saw expected log")
             assert self.wrote_log_line
@@ -550,12 +578,12 @@ class RemoteAccountTest(Test):
         timeout = 3
         try:
             with node.account.monitor_log(self.account_service.log_file) as monitor:
-                start = time.time()
+                start = time.monotonic()
                 monitor.wait_until('foo', timeout_sec=timeout, err_msg="Never saw expected log")
                 assert False, "Log monitoring should have timed out and thrown an exception"
         except TimeoutError:
             # expected
-            end = time.time()
+            end = time.monotonic()
             assert end - start > timeout, "Should have waited full timeout period while monitoring the log"
 
     @cluster(num_nodes=1)
@@ -564,9 +592,11 @@ class RemoteAccountTest(Test):
         grep_str = '"nc -l -p 5000"'
 
         def get_pids():
-            pid_cmd = f"ps ax | grep -i {grep_str} | grep -v grep | awk '{{print $1}}'"
+            # the bracket keeps pgrep from matching the remote shell whose command line contains the pattern
+            pid_cmd = "pgrep -f 'nc -l -p 500[0]'"
 
-            return list(node.account.ssh_capture(pid_cmd, callback=int))
+            # pgrep exits 1 when nothing matches
+            return list(node.account.ssh_capture(pid_cmd, allow_fail=True, callback=int))
 
         node = self.account_service.nodes[0]
 
@@ -604,9 +634,9 @@ class TestIterWrapper(Test):
         for i in range(self.line_num):
             assert output.has_next()  # with timeout in case of hang
             assert output.next().strip() == str(i)
-        start = time.time()
+        start = time.monotonic()
         assert output.has_next() is False
-        stop = time.time()
+        stop = time.monotonic()
         assert stop - start < self.eps, "has_next() should return immediately"
 
     def test_iter_wrapper_timeout(self):
@@ -619,20 +649,19 @@ class TestIterWrapper(Test):
             assert output.next().strip() == str(i)
 
         timeout = .25
-        start = time.time()
+        start = time.monotonic()
         # This check will last for the duration of the timeout because the the remote tail -F process
         # remains running, and the output stream is not closed.
         assert output.has_next(timeout_sec=timeout) is False
-        stop = time.time()
+        stop = time.monotonic()
         assert (stop - start >= timeout) and (stop - start) < timeout + self.eps, \
             "has_next() should return right after %s second" % str(timeout)
 
     def teardown(self):
-        # tail -F call above will leave stray processes, so clean up
-        cmd = "for p in $(ps ax | grep -v grep | grep \"%s\" | awk '{print $1}'); do kill $p; done" % self.temp_file
-        self.node.account.ssh(cmd, allow_fail=True)
-
-        self.node.account.ssh("rm -f " + self.temp_file, allow_fail=True)
+        # tail -F call above will leave stray processes, so clean up. The bracket keeps pkill from matching
+        # (and killing) the remote shell running this command, whose own command line contains the pattern
+        pattern = "tail -F [%s]%s" % (self.temp_file[0], self.temp_file[1:])
+        self.node.account.ssh("pkill -f '%s'; rm -f %s" % (pattern, self.temp_file), allow_fail=True)
 
 
 class RemoteAccountCompressedTest(Test):
@@ -44,7 +44,7 @@ class CheckJsonCluster(object):
 
     @staticmethod
     def cluster_hostnames(nodes):
-        return set([node.account.hostname for node in nodes])
+        return {node.account.hostname for node in nodes}
 
     def check_cluster_size(self):
         cluster = create_json_cluster({"nodes": []})
@@ -136,6 +136,6 @@ class CheckJsonCluster(object):
                 {"ssh_config": {"host": "localhost1"}},
                 {"ssh_config": {"host": "localhost2"}},
                 {"ssh_config": {"host": "localhost3"}}]})
-        hosts = set(["localhost1", "localhost2", "localhost3"])
+        hosts = {"localhost1", "localhost2", "localhost3"}
         nodes = cluster.alloc(cluster.available())
-        assert hosts == set(node.name for node in nodes)
+        assert hosts == {node.name for node in nodes}
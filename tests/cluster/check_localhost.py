@@ -26,8 +26,7 @@ class CheckLocalhostCluster(object):
         len(self.cluster) >= 2 ** 31 - 1
 
     def check_pickleable(self):
-        cluster = LocalhostCluster()
-        pickle.dumps(cluster)
+        pickle.dumps(self.cluster)
 
     def check_request_free(self):
         available = self.cluster.num_available_nodes()
@@ -12,21 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from ducktape.cluster.cluster import ClusterNode
 from ducktape.errors import TimeoutError
 from tests.ducktape_mock import MockAccount
-from tests.test_utils import find_available_port
 from ducktape.cluster.remoteaccount import RemoteAccount
 from ducktape.cluster.remoteaccount import RemoteAccountSSHConfig
+from mock import Mock, PropertyMock, patch
+from paramiko import SFTPAttributes, SSHException
 import pytest
 
+import io
 import logging
+import os
+import shutil
+import tempfile
 from threading import Thread
-from http.server import SimpleHTTPRequestHandler
+from http.server import BaseHTTPRequestHandler
 import socketserver
 import threading
 import time
 
 
+DUMMY_SSH_CONFIG = RemoteAccountSSHConfig.from_string(
+    """
+    Host dummy_host.com
+        Hostname dummy_host.name.com
+        Port 22
+        User dummy
+        ConnectTimeout 1
+    """)
+
+
 class DummyException(Exception):
     pass
 
@@ -39,14 +55,27 @@ def raise_no_error_checker(error, remote_account):
     pass
 
 
+class OkHTTPRequestHandler(BaseHTTPRequestHandler):
+    """Answers every GET with an empty 200 response, without touching the filesystem or logging to stderr"""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
 class SimpleServer(object):
-    """Helper class which starts a simple server listening on localhost at the specified port
+    """Helper class which starts a simple server listening on localhost on a free port chosen by the OS
     """
 
     def __init__(self):
-        self.port = find_available_port()
-        self.handler = SimpleHTTPRequestHandler
-        self.httpd = socketserver.TCPServer(("", self.port), self.handler)
+        self.handler = OkHTTPRequestHandler
+        # bind to port 0 so the OS picks a free port; there is no window in which another process can take it
+        self.httpd = socketserver.TCPServer(("", 0), self.handler)
+        self.port = self.httpd.server_address[1]
         self.close_signal = threading.Event()
         self.server_started = False
 
@@ -57,7 +86,8 @@ class SimpleServer(object):
 
             if not self.close_signal.is_set():
                 self.server_started = True
-                self.httpd.serve_forever()
+                # a short poll interval lets stop() return promptly instead of waiting out the 0.5s default
+                self.httpd.serve_forever(poll_interval=.05)
 
         self.background_thread = Thread(target=run)
         self.background_thread.start()
@@ -70,6 +100,7 @@ class SimpleServer(object):
         self.background_thread.join(timeout=.5)
         if self.background_thread.is_alive():
             raise Exception("SimpleServer failed to stop quickly")
+        self.httpd.server_close()
 
 
 class CheckRemoteAccount(object):
@@ -86,7 +117,7 @@ class CheckRemoteAccount(object):
         """Check waiting with timeout"""
 
         timeout = 1
-        start = time.time()
+        start = time.monotonic()
         self.server.start(delay_sec=5)
 
         try:
@@ -96,7 +127,7 @@ class CheckRemoteAccount(object):
             # expected behavior. Now check that we're reasonably close to the expected timeout
             # This is a fairly loose check since there are various internal timeouts that can affect the overall
             # timing
-            actual_timeout = time.time() - start
+            actual_timeout = time.monotonic() - start
             assert abs(actual_timeout - timeout) / timeout < 1
 
     @pytest.mark.parametrize("checkers", [[raise_error_checker],
@@ -104,15 +135,7 @@ class CheckRemoteAccount(object):
                                           [raise_error_checker, raise_no_error_checker]])
     def check_ssh_checker(self, checkers):
         self.server.start()
-        ssh_config = RemoteAccountSSHConfig.from_string(
-            """
-        Host dummy_host.com
-            Hostname dummy_host.name.com
-            Port 22
-            User dummy
-            ConnectTimeout 1
-        """)
-        self.account = RemoteAccount(ssh_config, ssh_exception_checks=checkers)
+        self.account = RemoteAccount(DUMMY_SSH_CONFIG, ssh_exception_checks=checkers)
         with pytest.raises(DummyException):
             self.account.ssh('echo test')
 
@@ -120,6 +143,110 @@ class CheckRemoteAccount(object):
         self.server.stop()
 
 
+class LocalSFTPFile(io.FileIO):
+    def prefetch(self, file_size=None):
+        pass
+
+
+class LocalSFTPClient(object):
+    """Stand-in for paramiko's SFTPClient which operates on the local filesystem and counts stat calls."""
+
+    def __init__(self):
+        self.num_stats = 0
+
+    def stat(self, path):
+        self.num_stats += 1
+        return os.stat(path)
+
+    def lstat(self, path):
+        self.num_stats += 1
+        return os.lstat(path)
+
+    def listdir_attr(self, path):
+        return [SFTPAttributes.from_stat(os.lstat(os.path.join(path, name)), name) for name in os.listdir(path)]
+
+    def get(self, remotepath, localpath):
+        shutil.copyfile(remotepath, localpath)
+
+    def put(self, localpath, remotepath):
+        shutil.copyfile(localpath, remotepath)
+
+    def mkdir(self, path, mode):
+        os.mkdir(path, mode)
+
+    def open(self, filename, mode="r"):
+        return LocalSFTPFile(filename, mode)
+
+    def putfo(self, fl, remotepath):
+        with open(remotepath, "wb") as f:
+            shutil.copyfileobj(fl, f)
+
+
+class CheckRemoteAccountCopy(object):
+    def setup_method(self, _):
+        self.temp_dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.temp_dir, "src")
+        os.makedirs(os.path.join(self.src, "d0", "d1"))
+        for path, contents in [("a_file", "hello"), ("d0/b_file", "world"), ("d0/d1/c_file", "!")]:
+            with open(os.path.join(self.src, path), "w") as f:
+                f.write(contents)
+        os.symlink(os.path.join(self.src, "d0", "d1"), os.path.join(self.src, "d1-link"))
+
+        self.sftp = LocalSFTPClient()
+        self.account = MockAccount()
+
+    def verify_tree(self, dest):
+        for path, contents in [("a_file", "hello"), ("d0/b_file", "world"), ("d0/d1/c_file", "!"),
+                               ("d1-link/c_file", "!")]:
+            with open(os.path.join(dest, path)) as f:
+                assert f.read() == contents
+        # symlinks are copied as what they point to
+        assert not os.path.islink(os.path.join(dest, "d1-link"))
+
+    def check_copy_from_dir(self):
+        dest = os.path.join(self.temp_dir, "dest")
+        with patch.object(MockAccount, "sftp_client", new_callable=PropertyMock, return_value=self.sftp):
+            self.account.copy_from(self.src, dest)
+
+        self.verify_tree(dest)
+        # isfile and isdir on src and on the symlink, which has to be resolved; not one per entry
+        assert self.sftp.num_stats == 4
+
+    def check_copy_to_dir(self):
+        dest = os.path.join(self.temp_dir, "dest")
+        with patch.object(MockAccount, "sftp_client", new_callable=PropertyMock, return_value=self.sftp):
+            self.account.copy_to(self.src, dest)
+
+        self.verify_tree(dest)
+        # only the initial check whether dest is an existing directory touches the remote side
+        assert self.sftp.num_stats == 1
+
+    def check_copy_between_file(self):
+        dest_dir = os.path.join(self.temp_dir, "dest")
+        os.mkdir(dest_dir)
+        dest_node = ClusterNode(MockAccount())
+        with patch.object(MockAccount, "sftp_client", new_callable=PropertyMock, return_value=self.sftp), \
+                patch.object(MockAccount, "copy_from", side_effect=AssertionError("should not go via local disk")):
+            # into an existing directory, and to a new path
+            self.account.copy_between(os.path.join(self.src, "a_file"), dest_dir, dest_node)
+            self.account.copy_between(os.path.join(self.src, "a_file"), os.path.join(dest_dir, "renamed"), dest_node)
+
+        for name in ["a_file", "renamed"]:
+            with open(os.path.join(dest_dir, name)) as f:
+                assert f.read() == "hello"
+
+    def check_copy_between_file_runs_dest_ssh_checks(self):
+        """An sftp failure while uploading to dest_node goes through dest_node's ssh exception checks."""
+        self.sftp.putfo = Mock(side_effect=SSHException("upload failed"))
+        dest_node = ClusterNode(MockAccount(ssh_exception_checks=[raise_error_checker]))
+        with patch.object(MockAccount, "sftp_client", new_callable=PropertyMock, return_value=self.sftp):
+            with pytest.raises(DummyException):
+                self.account.copy_between(os.path.join(self.src, "a_file"), self.temp_dir, dest_node)
+
+    def teardown_method(self, _):
+        shutil.rmtree(self.temp_dir)
+
+
 class CheckRemoteAccountEquality(object):
 
     def check_remote_account_equality(self):
@@ -136,3 +263,17 @@ class CheckRemoteAccountEquality(object):
         r2 = RemoteAccount(**kwargs)
 
         assert r1 == r2
+
+    def check_remote_account_equality_ignores_connection_state(self):
+        """Accounts for the same host compare and hash equal whether or not they have connected yet."""
+        ssh_config = RemoteAccountSSHConfig(host="thehost", hostname="localhost", port=22)
+        r1 = RemoteAccount(ssh_config, externally_routable_ip="345", ssh_exception_checks=[raise_error_checker])
+        r2 = RemoteAccount(ssh_config, externally_routable_ip="345")
+        r1._ssh_client = object()
+
+        assert r1 == r2
+        assert hash(r1) == hash(r2)
+        assert len({r1, r2}) == 1
+
+        r2.externally_routable_ip = "678"
+        assert r1 != r2